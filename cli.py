@@ -2,23 +2,30 @@
 
 import argparse
 import sys
-from pathlib import Path
+from typing import List, Optional
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+_logger = None
 
-from src.main_app import IPOAlert
-from src.logger import setup_logger
 
-logger = setup_logger("cli")
+def _get_logger():
+    """Return the CLI logger, configuring it on first use."""
+    global _logger
+    if _logger is None:
+        from src.logger import setup_logger
 
+        _logger = setup_logger("cli")
+    return _logger
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser."""
-    parser = argparse.ArgumentParser(
-        description="IPO Alert Automation - Monitor and notify about IPO openings",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+# Subcommands and their help text; main() only adds arguments for the one in use
+_COMMANDS = {
+    "run": "Run IPO alert process",
+    "health": "Perform system health check",
+    "stats": "Show application statistics",
+    "cleanup": "Clean up old records",
+}
+
+_EPILOG = """
 Examples:
   python cli.py run                    # Run IPO alert process
   python cli.py run --dry-run         # Run without sending emails
@@ -26,36 +33,63 @@ Examples:
   python cli.py health                # Check system health
   python cli.py stats                 # Show statistics
   python cli.py cleanup               # Clean up old records
-        """,
+        """
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in the arguments, if it is a known one."""
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _COMMANDS else None
+    return None
+
+
+def _add_command_arguments(command: str, command_parser) -> None:
+    """Register the arguments of a single subcommand."""
+    if command == "run":
+        command_parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Run without sending emails or saving notifications",
+        )
+        command_parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Force notification even if already sent",
+        )
+    elif command == "cleanup":
+        command_parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Number of days to keep records (default: 30)",
+        )
+
+
+def create_parser(
+    command: Optional[str] = None, show_examples: bool = True
+) -> argparse.ArgumentParser:
+    """
+    Create command line argument parser.
+
+    Args:
+        command: Subcommand being invoked; only its arguments are registered,
+            the others are added by name so they still appear in --help.
+            If None, the arguments of every subcommand are registered
+        show_examples: Whether to include the usage examples in --help
+    """
+    parser = argparse.ArgumentParser(
+        description="IPO Alert Automation - Monitor and notify about IPO openings",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG if show_examples else None,
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Run command
-    run_parser = subparsers.add_parser("run", help="Run IPO alert process")
-    run_parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Run without sending emails or saving notifications",
-    )
-    run_parser.add_argument(
-        "--force", action="store_true", help="Force notification even if already sent"
-    )
-
-    # Health check command
-    subparsers.add_parser("health", help="Perform system health check")
-
-    # Stats command
-    subparsers.add_parser("stats", help="Show application statistics")
-
-    # Cleanup command
-    cleanup_parser = subparsers.add_parser("cleanup", help="Clean up old records")
-    cleanup_parser.add_argument(
-        "--days",
-        type=int,
-        default=30,
-        help="Number of days to keep records (default: 30)",
-    )
+    for name, help_text in _COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if command is None or name == command:
+            _add_command_arguments(name, command_parser)
 
     return parser
 
@@ -63,24 +97,28 @@ Examples:
 def handle_run_command(args) -> int:
     """Handle the run command."""
     try:
+        from src.main_app import IPOAlert
+
         app = IPOAlert()
         success = app.run(dry_run=args.dry_run, force=args.force)
 
         if success:
-            logger.info("IPO alert process completed successfully")
+            _get_logger().info("IPO alert process completed successfully")
             return 0
         else:
-            logger.error("IPO alert process failed")
+            _get_logger().error("IPO alert process failed")
             return 1
 
     except Exception as e:
-        logger.error(f"Failed to run IPO alert: {e}")
+        _get_logger().error(f"Failed to run IPO alert: {e}")
         return 1
 
 
 def handle_health_command(args) -> int:
     """Handle the health check command."""
     try:
+        from src.main_app import IPOAlert
+
         app = IPOAlert()
         checks = app.health_check()
 
@@ -102,13 +140,15 @@ def handle_health_command(args) -> int:
         return 0 if all_healthy else 1
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        _get_logger().error(f"Health check failed: {e}")
         return 1
 
 
 def handle_stats_command(args) -> int:
     """Handle the stats command."""
     try:
+        from src.main_app import IPOAlert
+
         app = IPOAlert()
         stats = app.get_stats()
 
@@ -133,13 +173,15 @@ def handle_stats_command(args) -> int:
         return 0
 
     except Exception as e:
-        logger.error(f"Failed to get stats: {e}")
+        _get_logger().error(f"Failed to get stats: {e}")
         return 1
 
 
 def handle_cleanup_command(args) -> int:
     """Handle the cleanup command."""
     try:
+        from src.main_app import IPOAlert
+
         app = IPOAlert()
         success = app.cleanup(days_to_keep=args.days)
 
@@ -153,32 +195,36 @@ def handle_cleanup_command(args) -> int:
             return 1
 
     except Exception as e:
-        logger.error(f"Cleanup failed: {e}")
+        _get_logger().error(f"Cleanup failed: {e}")
         return 1
 
 
 def main():
     """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    # The examples are only shown by --help, so skip them otherwise
+    parser = create_parser(
+        _sniff_subcommand(argv), show_examples="-h" in argv or "--help" in argv
+    )
+    args = parser.parse_args(argv)
 
     if not args.command:
+        parser.epilog = _EPILOG
         parser.print_help()
         return 1
 
     # Route to appropriate handler
-    handlers = {
-        "run": handle_run_command,
-        "health": handle_health_command,
-        "stats": handle_stats_command,
-        "cleanup": handle_cleanup_command,
-    }
-
-    handler = handlers.get(args.command)
-    if handler:
-        return handler(args)
+    command = args.command
+    if command == "run":
+        return handle_run_command(args)
+    elif command == "health":
+        return handle_health_command(args)
+    elif command == "stats":
+        return handle_stats_command(args)
+    elif command == "cleanup":
+        return handle_cleanup_command(args)
     else:
-        print(f"Unknown command: {args.command}")
+        print(f"Unknown command: {command}")
         return 1
 
 
@@ -15,10 +15,6 @@ GitHub: SLASH217
 """
 
 import sys
-from pathlib import Path
-
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 try:
     from src.main_app import IPOAlert
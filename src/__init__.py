@@ -0,0 +1,23 @@
+"""IPO Alert application package."""
+
+from importlib import import_module
+
+__all__ = ["IPOAlert", "Config", "IPODatabase"]
+
+# Public names are imported from their modules on first access, so
+# ``from src import Config`` doesn't pull in the scraper and email stack
+_LAZY_IMPORTS = {
+    "IPOAlert": ".main_app",
+    "Config": ".config",
+    "IPODatabase": ".database",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
@@ -1,21 +1,30 @@
 """Configuration management for IPO Alert application."""
 
 import os
+import re
 from dataclasses import dataclass
-from typing import List
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Tuple
 
-# Load environment variables
-load_dotenv()
+# A single address: one "@", no whitespace and a dot in the domain
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load variables from the .env file, at most once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@dataclass(frozen=True)
 class Config:
     """Configuration class for IPO Alert application."""
 
     email_address: str
     app_password: str
-    recipient_emails: List[str]
+    recipient_emails: Tuple[str, ...]
     source_url: str = "https://www.sharesansar.com"
     data_path: str = "data/share.html"
     notified_ipos_file: str = "data/ipo_history.json"
@@ -28,6 +37,8 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Create configuration from environment variables."""
+        _load_env()
+
         email_address = os.getenv("EMAIL_ADDRESS")
         app_password = os.getenv("APP_PASSWORD")
 
@@ -37,9 +48,9 @@ class Config:
             )
 
         emails_str = os.getenv("RECIPIENT_EMAIL_LIST", "")
-        recipient_emails = [
+        recipient_emails = tuple(
             email.strip() for email in emails_str.split(",") if email.strip()
-        ]
+        )
 
         if not recipient_emails:
             raise ValueError(
@@ -58,9 +69,15 @@ class Config:
             resend_from_email=os.getenv("RESEND_FROM_EMAIL"),
         )
 
+    def __post_init__(self):
+        """Validate configuration once, at construction."""
+        # Accept any iterable of recipients but store an immutable tuple
+        object.__setattr__(self, "recipient_emails", tuple(self.recipient_emails))
+        self.validate()
+
     def validate(self) -> None:
         """Validate configuration parameters."""
-        if not self.email_address or "@" not in self.email_address:
+        if not self.email_address or not _EMAIL_RE.fullmatch(self.email_address):
             raise ValueError("Invalid email address")
 
         if not self.app_password:
@@ -69,6 +86,8 @@ class Config:
         if not self.recipient_emails:
             raise ValueError("At least one recipient email must be provided")
 
-        for email in self.recipient_emails:
-            if "@" not in email:
-                raise ValueError(f"Invalid recipient email: {email}")
+        invalid = next(
+            (e for e in self.recipient_emails if not _EMAIL_RE.fullmatch(e)), None
+        )
+        if invalid is not None:
+            raise ValueError(f"Invalid recipient email: {invalid}")
@@ -1,15 +1,48 @@
 """Database management for IPO notification records."""
 
 import json
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional
 
 from .logger import get_logger
 from .models import IPOInfo, NotificationRecord
 
 logger = get_logger(__name__)
 
+# orjson parses and serialises in C; fall back to the stdlib if missing.
+# Output stays indented: the history file is committed by the cloud workflow
+# and should produce readable diffs.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Dict) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _notified_at(record_data) -> Optional[str]:
+    """Return the record's timestamp if it looks like ISO-8601, else None."""
+    notified_at = (
+        record_data.get("notified_at") if isinstance(record_data, dict) else None
+    )
+    if (
+        isinstance(notified_at, str)
+        and len(notified_at) >= 10
+        and notified_at[:4].isdigit()
+        and notified_at[4] == "-"
+    ):
+        return notified_at
+    return None
+
 
 class IPODatabase:
     """Database for managing IPO notification records."""
@@ -17,6 +50,12 @@ class IPODatabase:
     def __init__(self, db_path: str = "data/ipo_history.json"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Parsed history, kept in memory and updated on every write
+        self._cache: Optional[Dict] = None
+        # True while the cached history has changes not yet written to disk
+        self._dirty = False
+        # mtime of the file the cache was read from or last written to
+        self._cache_mtime: Optional[int] = None
 
         # Ensure database file exists
         if not self.db_path.exists():
@@ -25,19 +64,19 @@ class IPODatabase:
     def _initialize_database(self) -> None:
         """Initialize empty database file."""
         try:
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump({}, f, indent=2)
-            logger.info(f"Initialized new database at {self.db_path}")
+            self._save_history({})
+            logger.info("Initialized new database at %s", self.db_path)
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
 
-    def save_ipo_notification(self, ipo_info: IPOInfo) -> bool:
+    def save_ipo_notification(self, ipo_info: IPOInfo, flush: bool = True) -> bool:
         """
         Save IPO notification record.
 
         Args:
             ipo_info: IPO information that was notified
+            flush: If False, only record it in memory; call flush() to write
 
         Returns:
             True if successful, False otherwise
@@ -52,17 +91,37 @@ class IPODatabase:
             )
 
             data[ipo_info.company_name] = notification_record.to_dict()
+            self._save_history(data, flush=flush)
 
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Saved notification record for {ipo_info.company_name}")
+            logger.info("Saved notification record for %s", ipo_info.company_name)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save notification record: {e}")
+            logger.error("Failed to save notification record: %s", e)
             return False
 
+    def save_ipo_notifications(self, ipo_infos: List[IPOInfo]) -> int:
+        """
+        Save several IPO notification records with a single file write.
+
+        Args:
+            ipo_infos: IPO information that was notified
+
+        Returns:
+            Number of records saved
+        """
+        saved = sum(
+            self.save_ipo_notification(ipo_info, flush=False) for ipo_info in ipo_infos
+        )
+
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Failed to write notification records: %s", e)
+            return 0
+
+        return saved
+
     def is_already_notified(self, company_name: str) -> bool:
         """
         Check if IPO was already notified.
@@ -80,38 +139,95 @@ class IPODatabase:
             if is_notified:
                 record = data[company_name]
                 logger.info(
-                    f"IPO {company_name} was already notified at {record.get('notified_at')}"
+                    "IPO %s was already notified at %s",
+                    company_name,
+                    record.get("notified_at"),
                 )
 
             return is_notified
 
         except Exception as e:
-            logger.error(f"Error checking notification status: {e}")
+            logger.error("Error checking notification status: %s", e)
             return False
 
+    def notified_company_names(self) -> FrozenSet[str]:
+        """
+        Get the names of all companies that were already notified.
+
+        Build this once per run and test membership against it rather than
+        calling is_already_notified for each company.
+
+        Returns:
+            Frozen set of notified company names
+        """
+        return frozenset(self.load_history())
+
     def load_history(self) -> Dict:
         """
         Load notification history from database.
 
+        The parsed history is cached and reused for as long as the file's
+        modification time is unchanged, so repeated loads cost a stat()
+        rather than a JSON parse, and edits made by another process are
+        still picked up.
+
         Returns:
             Dictionary containing notification history
         """
+        # Unflushed changes are newer than anything on disk
+        if self._dirty:
+            return self._cache
+
         try:
             if not self.db_path.exists():
-                return {}
+                self._cache = {}
+                self._cache_mtime = None
+                return self._cache
 
-            with open(self.db_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            mtime = self.db_path.stat().st_mtime_ns
+            if self._cache is not None and mtime == self._cache_mtime:
+                return self._cache
 
-            return data
+            self._cache = _json_loads(self.db_path.read_bytes())
+            self._cache_mtime = mtime
+            return self._cache
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in database file: {e}")
+            logger.error("Invalid JSON in database file: %s", e)
             return {}
         except Exception as e:
-            logger.error(f"Error loading history: {e}")
+            logger.error("Error loading history: %s", e)
             return {}
 
+    def _save_history(self, data: Dict, flush: bool = True) -> None:
+        """Make data the cached history and optionally write it to disk."""
+        self._cache = data
+        self._dirty = True
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write pending history changes to disk.
+
+        The file is written to a temporary sibling and renamed over the
+        database, so a crash mid-write never leaves a truncated history.
+        """
+        if not self._dirty or self._cache is None:
+            return
+
+        tmp_path = self.db_path.with_suffix(self.db_path.suffix + ".tmp")
+        try:
+            tmp_path.write_bytes(_json_dumps(self._cache))
+            os.replace(tmp_path, self.db_path)
+            self._cache_mtime = self.db_path.stat().st_mtime_ns
+        except Exception:
+            # Drop the unsaved changes so memory matches the file again
+            self._cache = None
+            self._dirty = False
+            raise
+        self._dirty = False
+
     def get_notification_records(self) -> List[NotificationRecord]:
         """
         Get all notification records.
@@ -128,13 +244,13 @@ class IPODatabase:
                     record = NotificationRecord.from_dict(record_data)
                     records.append(record)
                 except Exception as e:
-                    logger.warning(f"Skipping invalid record: {e}")
+                    logger.warning("Skipping invalid record: %s", e)
                     continue
 
             return records
 
         except Exception as e:
-            logger.error(f"Error getting notification records: {e}")
+            logger.error("Error getting notification records: %s", e)
             return []
 
     def cleanup_old_records(self, days_to_keep: int = 30) -> int:
@@ -151,34 +267,35 @@ class IPODatabase:
             data = self.load_history()
             cutoff_date = datetime.now().replace(
                 hour=0, minute=0, second=0, microsecond=0
-            )
-            cutoff_date = cutoff_date.replace(day=cutoff_date.day - days_to_keep)
+            ) - timedelta(days=days_to_keep)
 
-            original_count = len(data)
+            cutoff_iso = cutoff_date.isoformat()
 
-            # Filter out old records
+            # ISO-8601 timestamps sort lexicographically, so the raw strings are
+            # compared directly; records with a missing or malformed timestamp
+            # are kept
             filtered_data = {}
             for company, record_data in data.items():
-                try:
-                    notified_at = datetime.fromisoformat(record_data["notified_at"])
-                    if notified_at >= cutoff_date:
-                        filtered_data[company] = record_data
-                except Exception as e:
-                    logger.warning(f"Invalid date format in record for {company}: {e}")
-                    # Keep records with invalid dates
+                notified_at = _notified_at(record_data)
+                if notified_at is None:
+                    logger.warning("Invalid date format in record for %s", company)
+                    filtered_data[company] = record_data
+                elif notified_at >= cutoff_iso:
                     filtered_data[company] = record_data
 
-            # Save cleaned data
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump(filtered_data, f, indent=2, ensure_ascii=False)
+            removed_count = len(data) - len(filtered_data)
+            if removed_count == 0:
+                logger.info("Cleanup completed: no old records to remove")
+                return 0
 
-            removed_count = original_count - len(filtered_data)
-            logger.info(f"Cleanup completed: removed {removed_count} old records")
+            # Save cleaned data
+            self._save_history(filtered_data)
+            logger.info("Cleanup completed: removed %s old records", removed_count)
 
             return removed_count
 
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
             return 0
 
     def get_stats(self) -> Dict:
@@ -189,9 +306,9 @@ class IPODatabase:
             Dictionary containing database statistics
         """
         try:
-            records = self.get_notification_records()
+            data = self.load_history()
 
-            if not records:
+            if not data:
                 return {
                     "total_notifications": 0,
                     "first_notification": None,
@@ -199,16 +316,21 @@ class IPODatabase:
                     "database_size_kb": 0,
                 }
 
-            dates = [record.notified_at for record in records]
+            # ISO-8601 strings sort chronologically, so no record is parsed
+            iso_dates = [
+                record["notified_at"]
+                for record in data.values()
+                if isinstance(record.get("notified_at"), str)
+            ]
             file_size = self.db_path.stat().st_size / 1024  # KB
 
             return {
-                "total_notifications": len(records),
-                "first_notification": min(dates).isoformat(),
-                "last_notification": max(dates).isoformat(),
+                "total_notifications": len(data),
+                "first_notification": min(iso_dates, default=None),
+                "last_notification": max(iso_dates, default=None),
                 "database_size_kb": round(file_size, 2),
             }
 
         except Exception as e:
-            logger.error(f"Error getting database stats: {e}")
+            logger.error("Error getting database stats: %s", e)
             return {}
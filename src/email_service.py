@@ -1,10 +1,19 @@
 """Email service for sending IPO notifications."""
 
+import json
 import smtplib
+import threading
+import time
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
-from typing import List, Dict
+from email import policy
+from functools import cached_property
+from typing import Dict, Sequence
 
 from .config import Config
 from .logger import get_logger
@@ -12,6 +21,28 @@ from .models import IPOInfo
 
 logger = get_logger(__name__)
 
+# Request bodies are serialised straight to bytes; orjson is optional
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+
+except ImportError:
+
+    def _json_dumps(data: Dict) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+# Throttling and transient server errors are retried with exponential backoff,
+# honouring Retry-After; the final response is left to raise_for_status
+_RESEND_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    raise_on_status=False,
+)
+
 
 class BaseEmailProvider(ABC):
     """Abstract base class for email providers."""
@@ -26,6 +57,12 @@ class BaseEmailProvider(ABC):
         """Test the email service connection."""
         pass
 
+    def send_bulk(
+        self, subject: str, body: str, recipients: Sequence[str]
+    ) -> Dict[str, bool]:
+        """Send the same email to several recipients, one message each."""
+        return {email: self.send_email(subject, body, email) for email in recipients}
+
 
 class GmailProvider(BaseEmailProvider):
     """Gmail SMTP email provider."""
@@ -36,69 +73,136 @@ class GmailProvider(BaseEmailProvider):
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 587
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP session that is already upgraded to TLS and logged in."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.email_address, self.app_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _build_message(self, subject: str, body: str, to_header: str) -> bytes:
+        """Serialise a plain-text message, ready to pass to sendmail."""
+        msg = EmailMessage(policy=policy.SMTP)
+        msg["Subject"] = subject
+        msg["From"] = self.email_address
+        msg["To"] = to_header
+        msg.set_content(body)
+        return msg.as_bytes()
+
     def send_email(self, subject: str, body: str, to_email: str) -> bool:
         """Send email via Gmail SMTP."""
-        try:
-            msg = EmailMessage()
-            msg["Subject"] = subject
-            msg["From"] = self.email_address
-            msg["To"] = to_email
-            msg.set_content(body)
-
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.app_password)
-                server.send_message(msg)
-
-            logger.info(f"Gmail: Email sent successfully to {to_email}")
-            return True
+        return self.send_bulk(subject, body, [to_email])[to_email]
+
+    def send_bulk(
+        self, subject: str, body: str, recipients: Sequence[str]
+    ) -> Dict[str, bool]:
+        """Send email to several recipients in a single Gmail SMTP transaction."""
+        results = {email: False for email in recipients}
+        if not recipients:
+            return results
 
+        # Recipients are only named in the envelope, as with Bcc, so with
+        # several of them the visible To is the sender
+        to_header = recipients[0] if len(recipients) == 1 else self.email_address
+        message = self._build_message(subject, body, to_header)
+
+        try:
+            try:
+                refused = self._send_transaction(message, recipients)
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
         except smtplib.SMTPAuthenticationError:
-            logger.error(f"Gmail: SMTP authentication failed for {self.email_address}")
-            return False
-        except smtplib.SMTPRecipientsRefused:
-            logger.error(f"Gmail: Recipient refused: {to_email}")
-            return False
+            logger.error("Gmail: SMTP authentication failed for %s", self.email_address)
+            return results
         except smtplib.SMTPException as e:
-            logger.error(f"Gmail: SMTP error when sending to {to_email}: {e}")
-            return False
+            logger.error("Gmail: SMTP error during bulk send: %s", e)
+            return results
         except Exception as e:
-            logger.error(
-                f"Gmail: Unexpected error when sending email to {to_email}: {e}"
-            )
-            return False
+            logger.error("Gmail: Unexpected error when sending email: %s", e)
+            return results
+
+        for to_email in recipients:
+            if to_email in refused:
+                logger.error("Gmail: Recipient refused: %s", to_email)
+            else:
+                results[to_email] = True
+                logger.info("Gmail: Email sent successfully to %s", to_email)
+
+        return results
+
+    def _send_transaction(self, message: bytes, recipients: Sequence[str]) -> Dict:
+        """
+        Send one message to every recipient with a single MAIL/RCPT/DATA exchange.
+
+        The session is reopened once if the server drops it.
+
+        Returns:
+            Recipients the server refused, mapped to its SMTP response
+        """
+        try:
+            with self._connect() as server:
+                return server.sendmail(self.email_address, recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            logger.warning("Gmail: Server disconnected, reconnecting")
+
+        with self._connect() as server:
+            return server.sendmail(self.email_address, recipients, message)
 
     def test_connection(self) -> bool:
         """Test Gmail SMTP connection."""
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_address, self.app_password)
+            with self._connect():
+                pass
 
             logger.info("Gmail: Connection test successful")
             return True
 
         except Exception as e:
-            logger.error(f"Gmail: Connection test failed: {e}")
+            logger.error("Gmail: Connection test failed: %s", e)
             return False
 
 
 class ResendProvider(BaseEmailProvider):
     """Resend API email provider."""
 
-    def __init__(self, api_key: str, from_email: str):
+    def __init__(
+        self,
+        api_key: str,
+        from_email: str,
+        max_workers: int = 4,
+        max_rps: float = 2.0,
+    ):
         self.api_key = api_key
         self.from_email = from_email
         self.api_url = "https://api.resend.com/emails"
-
-    def send_email(self, subject: str, body: str, to_email: str) -> bool:
-        """Send email via Resend API."""
-        try:
-            headers = {
+        self.max_workers = max_workers
+
+        # Requests are spaced at least this far apart to respect the API rate
+        # limit (Resend allows 2 requests/second by default)
+        self._min_interval = 1.0 / max_rps
+        self._next_send_at = 0.0
+        self._rate_lock = threading.Lock()
+
+        # Keep-alive session so repeated calls reuse the pooled TLS connection
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=_RESEND_RETRY),
+        )
+        self._session.headers.update(
+            {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
             }
+        )
 
+    def send_email(self, subject: str, body: str, to_email: str) -> bool:
+        """Send email via Resend API."""
+        try:
             data = {
                 "from": self.from_email,
                 "to": [to_email],
@@ -106,47 +210,69 @@ class ResendProvider(BaseEmailProvider):
                 "text": body,
             }
 
-            response = requests.post(
-                self.api_url, json=data, headers=headers, timeout=30
+            self._wait_for_send_slot()
+            # Retries resend the same key, so Resend delivers the message once
+            response = self._session.post(
+                self.api_url,
+                data=_json_dumps(data),
+                headers={"Idempotency-Key": str(uuid.uuid4())},
+                timeout=30,
             )
             response.raise_for_status()
 
-            logger.info(f"Resend: Email sent successfully to {to_email}")
+            logger.info("Resend: Email sent successfully to %s", to_email)
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Resend: API error when sending to {to_email}: {e}")
+            logger.error("Resend: API error when sending to %s: %s", to_email, e)
             return False
         except Exception as e:
             logger.error(
-                f"Resend: Unexpected error when sending email to {to_email}: {e}"
+                "Resend: Unexpected error when sending email to %s: %s", to_email, e
             )
             return False
 
+    def send_bulk(
+        self, subject: str, body: str, recipients: Sequence[str]
+    ) -> Dict[str, bool]:
+        """Send email to several recipients with concurrent, rate-limited API calls."""
+        if len(recipients) <= 1:
+            return super().send_bulk(subject, body, recipients)
+
+        workers = min(self.max_workers, len(recipients))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sent = executor.map(
+                lambda to_email: self.send_email(subject, body, to_email), recipients
+            )
+            return dict(zip(recipients, sent))
+
+    def _wait_for_send_slot(self) -> None:
+        """Block until another request fits within the rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send_at)
+            self._next_send_at = send_at + self._min_interval
+
+        if send_at > now:
+            time.sleep(send_at - now)
+
     def test_connection(self) -> bool:
         """Test Resend API connection."""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             # Test with a simple API call (this endpoint doesn't exist, but tests auth)
-            response = requests.get(
-                "https://api.resend.com/domains", headers=headers, timeout=30
-            )
+            response = self._session.get("https://api.resend.com/domains", timeout=30)
 
             if response.status_code in [200, 401, 403]:  # Auth-related responses
                 logger.info("Resend: API connection test successful")
                 return True
             else:
                 logger.error(
-                    f"Resend: API test failed with status {response.status_code}"
+                    "Resend: API test failed with status %s", response.status_code
                 )
                 return False
 
         except Exception as e:
-            logger.error(f"Resend: Connection test failed: {e}")
+            logger.error("Resend: Connection test failed: %s", e)
             return False
 
 
@@ -155,7 +281,11 @@ class EmailService:
 
     def __init__(self, config: Config):
         self.config = config
-        self.provider = self._create_provider()
+
+    @cached_property
+    def provider(self) -> BaseEmailProvider:
+        """Email provider, created on first use so non-sending runs skip it."""
+        return self._create_provider()
 
     def _create_provider(self) -> BaseEmailProvider:
         """Create the appropriate email provider based on configuration."""
@@ -185,7 +315,7 @@ class EmailService:
         return self.provider.send_email(subject, body, to_email)
 
     def send_bulk_email(
-        self, subject: str, body: str, recipients: List[str]
+        self, subject: str, body: str, recipients: Sequence[str]
     ) -> Dict[str, bool]:
         """
         Send email to multiple recipients.
@@ -198,14 +328,10 @@ class EmailService:
         Returns:
             Dictionary mapping email addresses to success status
         """
-        results = {}
-
-        for email in recipients:
-            success = self.send_email(subject, body, email)
-            results[email] = success
+        results = self.provider.send_bulk(subject, body, recipients)
 
         successful = sum(results.values())
-        logger.info(f"Bulk email sent: {successful}/{len(recipients)} successful")
+        logger.info("Bulk email sent: %s/%s successful", successful, len(recipients))
 
         return results
 
@@ -4,6 +4,12 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+# Shared by every logger this module configures
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+)
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)s - %(message)s")
+
 
 def setup_logger(
     name: str, log_file: str = "logs/ipo_alert.log", level: str = "INFO"
@@ -19,13 +25,17 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, level.upper()))
+
+    # Handlers are attached once; later calls only update the level
+    if getattr(logger, "_ipo_configured", False):
+        return logger
+
     # Ensure logs directory exists
     log_path = Path(log_file)
     log_path.parent.mkdir(exist_ok=True)
 
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
-
     # Clear existing handlers to avoid duplicates
     logger.handlers.clear()
 
@@ -33,18 +43,15 @@ def setup_logger(
     file_handler = RotatingFileHandler(
         log_file, maxBytes=1024 * 1024, backupCount=5  # 1MB
     )
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-    )
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_FILE_FORMATTER)
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
 
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
+    logger._ipo_configured = True
 
     return logger
 
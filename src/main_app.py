@@ -21,9 +21,8 @@ class IPOAlert:
             config_path: Optional path to configuration file
         """
         try:
-            # Load configuration
+            # Load configuration (validated on construction)
             self.config = Config.from_env()
-            self.config.validate()
 
             # Setup logging
             self.logger = setup_logger("ipo_alert", level=self.config.log_level)
@@ -53,66 +52,82 @@ class IPOAlert:
         try:
             self.logger.info("Starting IPO alert process")
 
-            # Test email connection first
+            # Fetch and save HTML data
+            html_content = self.scraper.fetch_and_save(self.config.data_path)
+            if html_content is None:
+                self.logger.error("Failed to fetch IPO data. Aborting.")
+                return False
+
+            # Skip everything else if the page matches the last successful run
+            if (
+                not dry_run
+                and not force
+                and not self.scraper.has_changed(html_content, self.config.data_path)
+            ):
+                self.logger.info("IPO page unchanged since last run. Skipping.")
+                return True
+
+            # Test email connection before doing any notification work
             if not dry_run and not self.email_service.test_email_connection():
                 self.logger.error("Email connection test failed. Aborting.")
                 return False
 
-            # Fetch and save HTML data
-            if not self.scraper.fetch_and_save(self.config.data_path):
-                self.logger.error("Failed to fetch IPO data. Aborting.")
-                return False
+            success = self._process_html(html_content, dry_run, force)
+            if success and not dry_run:
+                self.scraper.record_digest(html_content, self.config.data_path)
+            return success
 
-            # Read and process HTML data
-            html_content = self.scraper.read_html_file(self.config.data_path)
-            ipo_data = self.scraper.extract_ipo_details(html_content)
+        except Exception as e:
+            self.logger.error("Error during IPO alert process: %s", e)
+            return False
 
-            open_ipo = ipo_data.get("open_ipo")
-            if not open_ipo:
-                self.logger.info("No open IPOs found")
-                return True
+    def _process_html(self, html_content: bytes, dry_run: bool, force: bool) -> bool:
+        """Find the open IPO in the fetched page and notify about it."""
+        # Only the open IPO is needed, so skip parsing the rest of the table
+        open_ipo = self.scraper.find_open_ipo(html_content)
+        if not open_ipo:
+            self.logger.info("No open IPOs found")
+            return True
 
-            self.logger.info(f"Found open IPO: {open_ipo.company_name}")
+        self.logger.info("Found open IPO: %s", open_ipo.company_name)
 
-            # Check if already notified (unless forced)
-            if not force and self.database.is_already_notified(open_ipo.company_name):
-                self.logger.info(
-                    f"Already notified about {open_ipo.company_name}. Skipping."
-                )
-                return True
+        # Check if already notified (unless forced)
+        if (
+            not force
+            and open_ipo.company_name in self.database.notified_company_names()
+        ):
+            self.logger.info(
+                "Already notified about %s. Skipping.", open_ipo.company_name
+            )
+            return True
 
-            if dry_run:
-                self.logger.info(
-                    f"DRY RUN: Would send notification for {open_ipo.company_name}"
-                )
-                subject, body = self.email_service.prepare_ipo_notification(open_ipo)
-                self.logger.info(f"Subject: {subject}")
+        if dry_run:
+            self.logger.info(
+                "DRY RUN: Would send notification for %s", open_ipo.company_name
+            )
+            subject, body = self.email_service.prepare_ipo_notification(open_ipo)
+            self.logger.info("Subject: %s", subject)
+            self.logger.info("Recipients: %s", ", ".join(self.config.recipient_emails))
+            return True
+
+        # Send notifications
+        results = self.email_service.send_ipo_notification(open_ipo)
+
+        # Check if at least one email was sent successfully
+        successful_sends = sum(results.values())
+        if successful_sends > 0:
+            # Save notification record
+            if self.database.save_ipo_notifications([open_ipo]):
                 self.logger.info(
-                    f"Recipients: {', '.join(self.config.recipient_emails)}"
+                    "Successfully processed IPO notification for %s",
+                    open_ipo.company_name,
                 )
                 return True
-
-            # Send notifications
-            results = self.email_service.send_ipo_notification(open_ipo)
-
-            # Check if at least one email was sent successfully
-            successful_sends = sum(results.values())
-            if successful_sends > 0:
-                # Save notification record
-                if self.database.save_ipo_notification(open_ipo):
-                    self.logger.info(
-                        f"Successfully processed IPO notification for {open_ipo.company_name}"
-                    )
-                    return True
-                else:
-                    self.logger.warning("Failed to save notification record")
-                    return False
             else:
-                self.logger.error("Failed to send any notifications")
+                self.logger.warning("Failed to save notification record")
                 return False
-
-        except Exception as e:
-            self.logger.error(f"Error during IPO alert process: {e}")
+        else:
+            self.logger.error("Failed to send any notifications")
             return False
 
     def health_check(self) -> Dict[str, bool]:
@@ -130,24 +145,21 @@ class IPOAlert:
         }
 
         try:
-            # Check configuration
-            self.config.validate()
+            # Configuration is validated when it is loaded in __init__
             checks["config_valid"] = True
 
             # Check email connection
             checks["email_connection"] = self.email_service.test_email_connection()
 
             # Check source website accessibility
-            checks["source_accessible"] = self.scraper.fetch_and_save(
-                self.config.data_path.replace(".html", "_healthcheck.html")
-            )
+            checks["source_accessible"] = self.scraper.fetch_html() is not None
 
             # Check database accessibility
             test_data = self.database.load_history()
             checks["database_accessible"] = isinstance(test_data, dict)
 
         except Exception as e:
-            self.logger.error(f"Health check error: {e}")
+            self.logger.error("Health check error: %s", e)
 
         return checks
 
@@ -169,7 +181,7 @@ class IPOAlert:
             return {"database": db_stats, "configuration": config_stats}
 
         except Exception as e:
-            self.logger.error(f"Error getting stats: {e}")
+            self.logger.error("Error getting stats: %s", e)
             return {}
 
     def cleanup(self, days_to_keep: int = 30) -> bool:
@@ -184,8 +196,8 @@ class IPOAlert:
         """
         try:
             removed_count = self.database.cleanup_old_records(days_to_keep)
-            self.logger.info(f"Cleanup completed: removed {removed_count} records")
+            self.logger.info("Cleanup completed: removed %s records", removed_count)
             return True
         except Exception as e:
-            self.logger.error(f"Cleanup failed: {e}")
+            self.logger.error("Cleanup failed: %s", e)
             return False
@@ -2,13 +2,42 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
-@dataclass
-class IPOInfo:
+class _FrozenSlots:
+    """
+    Copy and pickle support for frozen dataclasses with hand-written slots.
+
+    The default protocol restores slots with setattr, which frozen classes
+    reject; this mirrors what dataclass(slots=True) adds on Python 3.10+.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class IPOInfo(_FrozenSlots):
     """IPO information data model."""
 
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "company_name",
+        "units_available",
+        "price_per_unit",
+        "start_date",
+        "end_date",
+        "status",
+        "_is_open",
+    )
+
     company_name: str
     units_available: str
     price_per_unit: str
@@ -21,13 +50,17 @@ class IPOInfo:
         if not self.company_name.strip():
             raise ValueError("Company name cannot be empty")
 
-        if not self.status.strip():
+        status = self.status.strip().lower()
+        if not status:
             raise ValueError("Status cannot be empty")
 
+        # Computed once from the status validated above
+        object.__setattr__(self, "_is_open", status == "open")
+
     @property
     def is_open(self) -> bool:
         """Check if IPO is currently open."""
-        return self.status.lower().strip() == "open"
+        return self._is_open
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert IPO info to dictionary."""
@@ -56,10 +89,12 @@ class IPOInfo:
             raise ValueError(f"Invalid row data or headings mapping: {e}")
 
 
-@dataclass
-class NotificationRecord:
+@dataclass(frozen=True)
+class NotificationRecord(_FrozenSlots):
     """Record of sent notifications."""
 
+    __slots__ = ("company_name", "notified_at", "ipo_data")
+
     company_name: str
     notified_at: datetime
     ipo_data: Dict[str, Any]
@@ -1,50 +1,101 @@
 """Web scraping functionality for IPO data."""
 
+import hashlib
+import json
 import re
-import time
-from functools import wraps
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple, Union
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+from lxml import html as lxml_html
 
 from .logger import get_logger
 from .models import IPOInfo
 
 logger = get_logger(__name__)
 
+# The page is served as UTF-8; decoding raw bytes inside libxml2 skips a
+# separate Python-level decode pass
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Used to cut the div#eipo block out of the raw page before parsing. The
+# marker needs a preceding space so attributes like data-id="eipo" don't match
+_IPO_SECTION_MARKER = re.compile(rb"""\sid=["']eipo["']""")
+_DIV_TAG_RE = re.compile(rb"<(/?)div\b", re.IGNORECASE)
+# Markup whose contents may hold a literal "</div>" that isn't a tag
+_RAW_TEXT_RE = re.compile(rb"<!--|<script\b|<style\b", re.IGNORECASE)
+
+# Compiled once so the per-row lookups don't re-parse the XPath expression
+_FIND_IPO_SECTION = etree.XPath('//*[@id="eipo"]')
+_FIND_TABLE_BODIES = etree.XPath(".//tbody")
+_FIND_HEADINGS = etree.XPath(".//th")
+_FIND_ROWS = etree.XPath("./tr")
+_FIND_CELLS = etree.XPath("./td")
+# Rows whose $status_col-th cell (1-based) reads "open", case-insensitively;
+# filtered inside libxml2 so other rows are never converted to Python.
+# normalize-space() ignores &nbsp;, so it is mapped to a space first
+_FIND_OPEN_ROWS = etree.XPath(
+    "./tr[td[$status_col]"
+    '[translate(normalize-space(translate(., "\u00a0", " ")), "OPEN", "open")'
+    ' = "open"]]'
+)
+
+# Connection errors, throttling and 5xx responses are retried; the final
+# response is left to raise_for_status
+_FETCH_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def _slice_ipo_section(html_content: bytes) -> Optional[bytes]:
+    """
+    Cut the ``<div id="eipo">`` element out of the raw page.
+
+    Args:
+        html_content: Raw HTML page
+
+    Returns:
+        The bytes of the IPO div including its closing tag, or None if it
+        cannot be located reliably
+    """
+    marker = _IPO_SECTION_MARKER.search(html_content)
+    if marker is None:
+        return None
+    marker_at = marker.start()
 
-class IPOExtractionError(Exception):
-    """Custom exception for IPO extraction errors."""
-
-    pass
+    # The marker must sit inside the opening <div ...> tag itself
+    start = html_content.rfind(b"<", 0, marker_at)
+    if start == -1 or not _DIV_TAG_RE.match(html_content, start):
+        return None
+    if b">" in html_content[start:marker_at]:
+        return None
 
+    depth = 0
+    for tag in _DIV_TAG_RE.finditer(html_content, start):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html_content.find(b">", tag.end())
+            if end == -1:
+                return None
+            section = html_content[start : end + 1]
+            # Comments and scripts can hide tags from the depth count
+            return None if _RAW_TEXT_RE.search(section) else section
 
-def retry(max_attempts: int = 3, delay: float = 1.0):
-    """Retry decorator for network operations."""
+    return None
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts - 1:
-                        logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
-                        )
-                        raise e
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-            return None
 
-        return wrapper
+class IPOExtractionError(Exception):
+    """Custom exception for IPO extraction errors."""
 
-    return decorator
+    pass
 
 
 class IPOScraper:
@@ -58,9 +109,22 @@ class IPOScraper:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
         )
+        # Transient failures are retried by urllib3 with exponential backoff
+        adapter = HTTPAdapter(max_retries=_FETCH_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def fetch_html(self) -> Optional[bytes]:
+        """
+        Fetch the website content into memory without saving it.
+
+        Returns:
+            The fetched HTML content if successful, None otherwise
+        """
+        response = self._get()
+        return response.content if response is not None else None
 
-    @retry(max_attempts=3, delay=2.0)
-    def fetch_and_save(self, file_path: str) -> bool:
+    def fetch_and_save(self, file_path: str) -> Optional[bytes]:
         """
         Fetch website content and save it locally.
 
@@ -68,36 +132,121 @@ class IPOScraper:
             file_path: Path to save the HTML content
 
         Returns:
-            True if successful, False otherwise
+            The fetched HTML content if successful, None otherwise
         """
+        response = self._get(headers=self._conditional_headers(file_path))
+        if response is None:
+            return None
+
         try:
-            logger.info(f"Fetching data from {self.source_url}")
-            response = self.session.get(self.source_url, timeout=30)
-            response.raise_for_status()
+            # Unchanged since the previous fetch: reuse the saved copy
+            if response.status_code == 304:
+                logger.info("Source not modified, using cached copy at %s", file_path)
+                return self.read_html_file(file_path)
 
             # Ensure directory exists
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(response.text)
+            html_content = response.content
+            with open(file_path, "wb") as file:
+                file.write(html_content)
 
-            logger.info(f"Data saved successfully to {file_path}")
-            return True
+            self._save_validators(response, file_path)
+
+            logger.info("Data saved successfully to %s", file_path)
+            return html_content
+
+        except Exception as e:
+            logger.error("Unexpected error when saving fetched data: %s", e)
+            return None
+
+    def _get(
+        self, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
+        """Request the source page, logging and returning None on failure."""
+        try:
+            logger.info("Fetching data from %s", self.source_url)
+            response = self.session.get(self.source_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            return response
 
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout error when fetching {self.source_url}")
-            return False
+            logger.error("Timeout error when fetching %s", self.source_url)
+            return None
         except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error when fetching {self.source_url}")
-            return False
+            logger.error("Connection error when fetching %s", self.source_url)
+            return None
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error when fetching {self.source_url}: {e}")
-            return False
+            logger.error("HTTP error when fetching %s: %s", self.source_url, e)
+            return None
         except Exception as e:
-            logger.error(f"Unexpected error when fetching data: {e}")
-            return False
+            logger.error("Unexpected error when fetching data: %s", e)
+            return None
+
+    def _conditional_headers(self, file_path: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the last fetch."""
+        meta_path = Path(f"{file_path}.meta")
+        if not Path(file_path).exists() or not meta_path.exists():
+            return {}
 
-    def read_html_file(self, file_path: str) -> str:
+        try:
+            meta = json.loads(meta_path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable cache metadata %s: %s", meta_path, e)
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _save_validators(self, response: requests.Response, file_path: str) -> None:
+        """Persist the response's ETag/Last-Modified for the next fetch."""
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        meta_path = Path(f"{file_path}.meta")
+        try:
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not save cache metadata to %s: %s", meta_path, e)
+
+    def has_changed(self, html_content: Union[str, bytes], file_path: str) -> bool:
+        """
+        Check whether the page differs from the last successfully processed one.
+
+        Args:
+            html_content: Freshly fetched HTML content
+            file_path: Path the HTML content is saved to
+
+        Returns:
+            True if the content changed or no previous digest exists
+        """
+        digest_path = Path(f"{file_path}.hash")
+        try:
+            previous = digest_path.read_text(encoding="ascii").strip()
+        except OSError:
+            return True
+        return previous != self._digest(html_content)
+
+    def record_digest(self, html_content: Union[str, bytes], file_path: str) -> None:
+        """Remember the digest of a successfully processed page."""
+        digest_path = Path(f"{file_path}.hash")
+        try:
+            digest_path.write_text(self._digest(html_content), encoding="ascii")
+        except OSError as e:
+            logger.warning("Could not save page digest to %s: %s", digest_path, e)
+
+    def _digest(self, html_content: Union[str, bytes]) -> str:
+        """Return a short content hash of the HTML page."""
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+        return hashlib.blake2b(html_content, digest_size=16).hexdigest()
+
+    def read_html_file(self, file_path: str) -> bytes:
         """
         Read HTML content from file.
 
@@ -105,114 +254,150 @@ class IPOScraper:
             file_path: Path to HTML file
 
         Returns:
-            HTML content as string
+            Raw HTML content as bytes
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
+            with open(file_path, "rb") as file:
                 content = file.read()
-            logger.debug(
-                f"Successfully read {len(content)} characters from {file_path}"
-            )
+            logger.debug("Successfully read %s bytes from %s", len(content), file_path)
             return content
         except FileNotFoundError:
-            logger.error(f"HTML file not found: {file_path}")
+            logger.error("HTML file not found: %s", file_path)
             raise
         except Exception as e:
-            logger.error(f"Error reading HTML file {file_path}: {e}")
+            logger.error("Error reading HTML file %s: %s", file_path, e)
             raise
 
-    def extract_ipo_details(self, html_content: str) -> Dict:
+    def extract_ipo_details(
+        self, html_content: Union[str, bytes], collect_all: bool = False
+    ) -> Dict:
         """
         Extract IPO details from HTML content.
 
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse, as text or raw UTF-8 bytes
+            collect_all: If True, parse every table row into ``data``; otherwise
+                stop at the first open IPO
 
         Returns:
             Dictionary containing headings, data, and open IPO info
         """
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            heading_map, table_body = self._locate_table(html_content)
 
-            # Find IPO section
-            ipo_div = self._safe_find(soup, "find", id="eipo")
-            if not ipo_div:
-                raise IPOExtractionError("IPO section not found on the page")
+            # Rows are parsed lazily so the scan can stop at the open IPO
+            data = []
+            rows = self._iter_table_rows(table_body)
+            open_ipo = self._get_open_ipo(rows, heading_map, data)
+            if collect_all:
+                data.extend(rows)
 
-            # Find table body
-            table_body = self._safe_find(ipo_div, "find", "tbody")
-            if not table_body:
-                raise IPOExtractionError("IPO table body not found")
-
-            # Extract headings and data
-            headings = self._extract_table_headings(ipo_div)
-            data = self._extract_table_data(table_body)
-            open_ipo = self._get_open_ipo(data, headings)
-
-            logger.info(f"Extracted {len(data)} IPO entries from HTML")
+            logger.info("Extracted %s IPO entries from HTML", len(data))
             return {
-                "headings": list(headings.keys()),
+                "headings": list(heading_map.keys()),
                 "data": data,
                 "open_ipo": open_ipo,
             }
 
         except Exception as e:
-            logger.error(f"Error extracting IPO details: {e}")
+            logger.error("Error extracting IPO details: %s", e)
             raise IPOExtractionError(f"Failed to extract IPO details: {e}")
 
-    def _safe_find(self, obj, method: str, *args, **kwargs):
-        """Safely execute BeautifulSoup find methods."""
-        try:
-            return getattr(obj, method)(*args, **kwargs)
-        except AttributeError:
-            return None
+    def find_open_ipo(self, html_content: Union[str, bytes]) -> Optional[IPOInfo]:
+        """
+        Find the first open IPO without parsing the rest of the table.
 
-    def _extract_table_headings(self, ipo_div) -> Dict[str, int]:
-        """Extract table headings and map them to column indices."""
-        headings = []
-        th_elements = self._safe_find(ipo_div, "find_all", "th") or []
+        Args:
+            html_content: HTML content to parse, as text or raw UTF-8 bytes
 
-        for th in th_elements:
-            heading_text = self._clean_text(th.text)
-            headings.append(heading_text)
+        Returns:
+            The first open IPO, or None if no IPO is open
+        """
+        try:
+            heading_map, table_body = self._locate_table(html_content)
+            status_col = heading_map.get("Status")
+            open_rows = (
+                _FIND_OPEN_ROWS(table_body, status_col=status_col + 1)
+                if status_col is not None
+                else []
+            )
+            candidates = (
+                [self._clean_text(td.text_content()) for td in _FIND_CELLS(row)]
+                for row in open_rows
+            )
+            return self._get_open_ipo(candidates, heading_map, [])
 
+        except Exception as e:
+            logger.error("Error finding open IPO: %s", e)
+            raise IPOExtractionError(f"Failed to find open IPO: {e}")
+
+    def _locate_table(
+        self, html_content: Union[str, bytes]
+    ) -> Tuple[Dict[str, int], etree._Element]:
+        """Parse the page and return the IPO heading map and table body."""
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+
+        # Parse only the IPO block when it can be cut out; if the slice lacks
+        # the section or its table, parse the whole page instead
+        section = _slice_ipo_section(html_content)
+        for source in (section, html_content):
+            if source is None:
+                continue
+            tree = lxml_html.fromstring(source, parser=_HTML_PARSER)
+            ipo_divs = _FIND_IPO_SECTION(tree)
+            table_bodies = _FIND_TABLE_BODIES(ipo_divs[0]) if ipo_divs else []
+            if table_bodies:
+                break
+            if source is section:
+                logger.debug("Sliced IPO section is incomplete, parsing full page")
+
+        if not ipo_divs:
+            raise IPOExtractionError("IPO section not found on the page")
+        ipo_div = ipo_divs[0]
+
+        if not table_bodies:
+            raise IPOExtractionError("IPO table body not found")
+
+        # Map headings to column indices
+        headings = [
+            self._clean_text(th.text_content()) for th in _FIND_HEADINGS(ipo_div)
+        ]
         if not headings:
             raise IPOExtractionError("No table headings found")
-
         heading_map = {heading: index for index, heading in enumerate(headings)}
-        logger.debug(f"Found headings: {list(heading_map.keys())}")
-        return heading_map
-
-    def _extract_table_data(self, table_body) -> List[List[str]]:
-        """Extract table data from tbody element."""
-        data = []
-        rows = self._safe_find(table_body, "find_all", "tr") or []
+        logger.debug("Found headings: %s", list(heading_map.keys()))
 
-        for row in rows:
-            cols = self._safe_find(row, "find_all", "td") or []
-            row_data = [self._clean_text(col.text) for col in cols]
-            if row_data:  # Only add non-empty rows
-                data.append(row_data)
+        return heading_map, table_bodies[0]
 
-        return data
+    def _iter_table_rows(self, table_body) -> Iterator[List[str]]:
+        """Yield cleaned cell text for each non-empty row of the table body."""
+        for row in _FIND_ROWS(table_body):
+            row_data = [self._clean_text(td.text_content()) for td in _FIND_CELLS(row)]
+            if row_data:  # Only yield non-empty rows
+                yield row_data
 
     def _get_open_ipo(
-        self, data: List[List[str]], headings: Dict[str, int]
+        self,
+        rows: Iterable[List[str]],
+        headings: Dict[str, int],
+        consumed: List[List[str]],
     ) -> Optional[IPOInfo]:
-        """Find and return the first open IPO."""
+        """Find and return the first open IPO, recording each row scanned."""
         status_col = headings.get("Status")
         if status_col is None:
             logger.warning("Status column not found in headings")
             return None
 
-        for row in data:
+        for row in rows:
+            consumed.append(row)
             if len(row) > status_col and row[status_col].strip().lower() == "open":
                 try:
                     ipo_info = IPOInfo.from_row_data(row, headings)
-                    logger.info(f"Found open IPO: {ipo_info.company_name}")
+                    logger.info("Found open IPO: %s", ipo_info.company_name)
                     return ipo_info
                 except ValueError as e:
-                    logger.warning(f"Error creating IPO info from row: {e}")
+                    logger.warning("Error creating IPO info from row: %s", e)
                     continue
 
         logger.info("No open IPOs found")
@@ -223,8 +408,5 @@ class IPOScraper:
         if not text:
             return ""
 
-        # Replace newlines and tabs with spaces
-        cleaned = text.replace("\n", " ").replace("\t", " ")
-        # Remove excess whitespace
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        return cleaned
+        # Collapse all whitespace runs (newlines, tabs, spaces) and strip
+        return " ".join(text.split())
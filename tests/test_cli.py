@@ -0,0 +1,65 @@
+"""Tests for the command line interface."""
+
+from unittest.mock import patch
+
+import pytest
+
+import cli
+
+
+class TestCreateParser:
+    """Test cases for create_parser."""
+
+    def test_run_dry_run(self):
+        """Test that the default parser accepts the run options."""
+        args = cli.create_parser().parse_args(["run", "--dry-run"])
+
+        assert args.command == "run"
+        assert args.dry_run is True
+        assert args.force is False
+
+    def test_cleanup_days(self):
+        """Test that the default parser accepts the cleanup options."""
+        args = cli.create_parser().parse_args(["cleanup", "--days", "7"])
+
+        assert args.command == "cleanup"
+        assert args.days == 7
+
+    def test_single_command_parser(self):
+        """Test that a parser for one subcommand only registers its options."""
+        parser = cli.create_parser("cleanup")
+
+        assert parser.parse_args(["cleanup", "--days", "7"]).days == 7
+        with pytest.raises(SystemExit):
+            parser.parse_args(["run", "--dry-run"])
+
+
+class TestMain:
+    """Test cases for the main entry point."""
+
+    def test_help_shows_examples(self, capsys):
+        """Test that a bare --help prints the usage examples."""
+        with patch("sys.argv", ["cli.py", "--help"]):
+            with pytest.raises(SystemExit) as exc_info:
+                cli.main()
+
+        assert exc_info.value.code == 0
+        output = capsys.readouterr().out
+        assert "Examples:" in output
+        assert "cleanup" in output
+
+    @patch("cli.handle_cleanup_command", return_value=0)
+    def test_cleanup_days_is_routed(self, mock_handler):
+        """Test that main parses the cleanup options and dispatches."""
+        with patch("sys.argv", ["cli.py", "cleanup", "--days", "7"]):
+            assert cli.main() == 0
+
+        assert mock_handler.call_args[0][0].days == 7
+
+    @patch("cli.handle_run_command", return_value=0)
+    def test_run_dry_run_is_routed(self, mock_handler):
+        """Test that main parses the run options and dispatches."""
+        with patch("sys.argv", ["cli.py", "run", "--dry-run"]):
+            assert cli.main() == 0
+
+        assert mock_handler.call_args[0][0].dry_run is True
@@ -1,11 +1,19 @@
 """Tests for configuration management."""
 
+import dataclasses
 import os
 import pytest
 from unittest.mock import patch
 from src.config import Config
 
 
+@pytest.fixture(autouse=True)
+def no_dotenv():
+    """Keep a developer's local .env file out of the environment under test."""
+    with patch("src.config._load_env"):
+        yield
+
+
 class TestConfig:
     """Test cases for Config class."""
 
@@ -24,7 +32,7 @@ class TestConfig:
 
         assert config.email_address == "test@example.com"
         assert config.app_password == "testpassword"
-        assert config.recipient_emails == ["recipient1@test.com", "recipient2@test.com"]
+        assert config.recipient_emails == ("recipient1@test.com", "recipient2@test.com")
 
     @patch.dict(os.environ, {}, clear=True)
     def test_config_from_env_missing_email(self):
@@ -50,36 +58,49 @@ class TestConfig:
 
     def test_config_validation_invalid_email(self):
         """Test Config validation with invalid email."""
-        config = Config(
-            email_address="invalid-email",
-            app_password="password",
-            recipient_emails=["valid@email.com"],
-        )
-
         with pytest.raises(ValueError, match="Invalid email address"):
-            config.validate()
+            Config(
+                email_address="invalid-email",
+                app_password="password",
+                recipient_emails=["valid@email.com"],
+            )
 
     def test_config_validation_invalid_recipient(self):
         """Test Config validation with invalid recipient email."""
+        with pytest.raises(ValueError, match="Invalid recipient email"):
+            Config(
+                email_address="valid@email.com",
+                app_password="password",
+                recipient_emails=["valid@email.com", "invalid-email"],
+            )
+
+    def test_config_validation_recipient_without_domain(self):
+        """Test Config validation with a recipient missing its domain."""
+        with pytest.raises(ValueError, match="Invalid recipient email: user@localhost"):
+            Config(
+                email_address="valid@email.com",
+                app_password="password",
+                recipient_emails=["user@localhost"],
+            )
+
+    def test_config_recipients_stored_as_tuple(self):
+        """Test that recipients passed as a list are frozen into a tuple."""
         config = Config(
             email_address="valid@email.com",
             app_password="password",
-            recipient_emails=["invalid-email"],
+            recipient_emails=["recipient@email.com"],
         )
 
-        with pytest.raises(ValueError, match="Invalid recipient email"):
-            config.validate()
+        assert config.recipient_emails == ("recipient@email.com",)
 
     def test_config_validation_empty_password(self):
         """Test Config validation with empty password."""
-        config = Config(
-            email_address="valid@email.com",
-            app_password="",
-            recipient_emails=["valid@email.com"],
-        )
-
         with pytest.raises(ValueError, match="App password cannot be empty"):
-            config.validate()
+            Config(
+                email_address="valid@email.com",
+                app_password="",
+                recipient_emails=["valid@email.com"],
+            )
 
     def test_config_validation_valid(self):
         """Test Config validation with valid data."""
@@ -91,3 +112,14 @@ class TestConfig:
 
         # Should not raise any exception
         config.validate()
+
+    def test_config_is_immutable(self):
+        """Test that configuration cannot be changed after creation."""
+        config = Config(
+            email_address="valid@email.com",
+            app_password="password",
+            recipient_emails=("recipient@email.com",),
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.log_level = "DEBUG"
@@ -0,0 +1,177 @@
+"""Tests for the IPO notification database."""
+
+import json
+import os
+import pytest
+from datetime import datetime, timedelta
+from src.database import IPODatabase
+from src.models import IPOInfo
+
+
+@pytest.fixture
+def ipo():
+    """An open IPO to record notifications for."""
+    return IPOInfo(
+        company_name="Test Company",
+        units_available="1,000,000",
+        price_per_unit="NPR 100",
+        start_date="2025-01-15",
+        end_date="2025-01-25",
+        status="open",
+    )
+
+
+class TestIPODatabase:
+    """Test cases for IPODatabase class."""
+
+    def test_save_and_check_notification(self, tmp_path, ipo):
+        """Test that a saved notification is reported as already notified."""
+        db_path = tmp_path / "history.json"
+        db = IPODatabase(str(db_path))
+
+        assert db.is_already_notified("Test Company") is False
+        assert db.save_ipo_notification(ipo) is True
+        assert db.is_already_notified("Test Company") is True
+
+        # A fresh instance sees the record written to disk
+        assert IPODatabase(str(db_path)).is_already_notified("Test Company") is True
+
+    def test_deferred_save_written_on_flush(self, tmp_path, ipo):
+        """Test that unflushed saves stay in memory until flush()."""
+        db_path = tmp_path / "history.json"
+        db = IPODatabase(str(db_path))
+
+        assert db.save_ipo_notification(ipo, flush=False) is True
+        assert db.is_already_notified("Test Company") is True
+        assert json.loads(db_path.read_text(encoding="utf-8")) == {}
+
+        db.flush()
+
+        assert "Test Company" in json.loads(db_path.read_text(encoding="utf-8"))
+        assert not (tmp_path / "history.json.tmp").exists()
+
+    def test_save_ipo_notifications(self, tmp_path, ipo):
+        """Test saving several notifications at once."""
+        db_path = tmp_path / "history.json"
+        other = IPOInfo(**{**ipo.to_dict(), "company_name": "Other Company"})
+
+        assert IPODatabase(str(db_path)).save_ipo_notifications([ipo, other]) == 2
+        assert set(json.loads(db_path.read_text(encoding="utf-8"))) == {
+            "Test Company",
+            "Other Company",
+        }
+
+    def test_notified_company_names(self, tmp_path, ipo):
+        """Test the set of notified company names."""
+        db = IPODatabase(str(tmp_path / "history.json"))
+        db.save_ipo_notification(ipo)
+
+        assert db.notified_company_names() == frozenset({"Test Company"})
+
+    def test_cleanup_old_records_skips_write_when_nothing_removed(self, tmp_path):
+        """Test that cleanup leaves the file untouched if all records are recent."""
+        db_path = tmp_path / "history.json"
+        db_path.write_text(
+            json.dumps({"Recent Company": {"notified_at": "2999-01-01T00:00:00"}}),
+            encoding="utf-8",
+        )
+        mtime = db_path.stat().st_mtime_ns
+
+        assert IPODatabase(str(db_path)).cleanup_old_records(days_to_keep=1) == 0
+        assert db_path.stat().st_mtime_ns == mtime
+
+    def test_cleanup_old_records_across_month_boundary(self, tmp_path):
+        """Test cleanup with a window longer than the current day of month."""
+        db_path = tmp_path / "history.json"
+        now = datetime.now()
+        db_path.write_text(
+            json.dumps(
+                {
+                    "Old Company": {
+                        "notified_at": (now - timedelta(days=90)).isoformat()
+                    },
+                    "New Company": {"notified_at": now.isoformat()},
+                }
+            ),
+            encoding="utf-8",
+        )
+        db = IPODatabase(str(db_path))
+
+        assert db.cleanup_old_records(days_to_keep=60) == 1
+        assert list(db.load_history()) == ["New Company"]
+
+    def test_cleanup_old_records_keeps_malformed_timestamps(self, tmp_path):
+        """Test that records with unparseable timestamps survive cleanup."""
+        db_path = tmp_path / "history.json"
+        db_path.write_text(
+            json.dumps(
+                {
+                    "Empty": {"notified_at": ""},
+                    "Bad": {"notified_at": "unknown"},
+                    "Num": {"notified_at": "20250101"},
+                    "Missing": {},
+                    "Not A Dict": "2000-01-01",
+                    "Old Company": {"notified_at": "2000-01-01T00:00:00"},
+                }
+            ),
+            encoding="utf-8",
+        )
+        db = IPODatabase(str(db_path))
+
+        assert db.cleanup_old_records(days_to_keep=30) == 1
+        assert list(db.load_history()) == [
+            "Empty",
+            "Bad",
+            "Num",
+            "Missing",
+            "Not A Dict",
+        ]
+
+    def test_get_stats_uses_raw_timestamps(self, tmp_path):
+        """Test that stats report the earliest and latest stored timestamps."""
+        db_path = tmp_path / "history.json"
+        db_path.write_text(
+            json.dumps(
+                {
+                    "B": {"notified_at": "2024-03-01T09:00:00"},
+                    "A": {"notified_at": "2023-12-31T23:59:59"},
+                    "C": {"notified_at": "2024-11-15T08:30:00"},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        stats = IPODatabase(str(db_path)).get_stats()
+
+        assert stats["total_notifications"] == 3
+        assert stats["first_notification"] == "2023-12-31T23:59:59"
+        assert stats["last_notification"] == "2024-11-15T08:30:00"
+
+    def test_load_history_is_cached(self, tmp_path, monkeypatch):
+        """Test that an unchanged file is parsed once and then served from memory."""
+        db_path = tmp_path / "history.json"
+        db_path.write_text(json.dumps({"Cached Company": {}}), encoding="utf-8")
+        db = IPODatabase(str(db_path))
+
+        assert "Cached Company" in db.load_history()
+
+        def fail(_):
+            raise AssertionError("history was parsed again")
+
+        monkeypatch.setattr("src.database._json_loads", fail)
+
+        assert "Cached Company" in db.load_history()
+
+    def test_load_history_reloads_modified_file(self, tmp_path):
+        """Test that the cache is dropped when the file changes on disk."""
+        db_path = tmp_path / "history.json"
+        db_path.write_text(json.dumps({"Cached Company": {}}), encoding="utf-8")
+        db = IPODatabase(str(db_path))
+
+        assert "Cached Company" in db.load_history()
+
+        db_path.write_text(json.dumps({"New Company": {}}), encoding="utf-8")
+        mtime = db_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(db_path, ns=(mtime, mtime))
+
+        assert list(db.load_history()) == ["New Company"]
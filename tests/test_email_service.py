@@ -0,0 +1,137 @@
+"""Tests for email providers."""
+
+import json
+import smtplib
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+from src.email_service import GmailProvider, ResendProvider
+
+
+class TestGmailProvider:
+    """Test cases for GmailProvider class."""
+
+    @patch("src.email_service.smtplib.SMTP")
+    def test_send_bulk_uses_single_transaction(self, mock_smtp):
+        """Test that a bulk send logs in once and sends one message to everyone."""
+        server = mock_smtp.return_value.__enter__.return_value
+        server.sendmail.return_value = {}
+        provider = GmailProvider("sender@example.com", "password")
+
+        results = provider.send_bulk(
+            "Subject", "Body", ["one@example.com", "two@example.com"]
+        )
+
+        assert results == {"one@example.com": True, "two@example.com": True}
+        assert mock_smtp.call_count == 1
+        mock_smtp.return_value.login.assert_called_once_with(
+            "sender@example.com", "password"
+        )
+        sender, envelope, payload = server.sendmail.call_args[0]
+        assert envelope == ["one@example.com", "two@example.com"]
+        assert b"To: sender@example.com\r\n" in payload
+        assert server.sendmail.call_count == 1
+
+    @patch("src.email_service.smtplib.SMTP")
+    def test_send_bulk_reports_refused_recipients(self, mock_smtp):
+        """Test that recipients refused by the server are marked failed."""
+        server = mock_smtp.return_value.__enter__.return_value
+        server.sendmail.return_value = {"two@example.com": (550, b"No such user")}
+        provider = GmailProvider("sender@example.com", "password")
+
+        results = provider.send_bulk(
+            "Subject", "Body", ["one@example.com", "two@example.com"]
+        )
+
+        assert results == {"one@example.com": True, "two@example.com": False}
+
+    @patch("src.email_service.smtplib.SMTP")
+    def test_send_bulk_reconnects_after_disconnect(self, mock_smtp):
+        """Test that a dropped session is reopened and the send retried once."""
+        server = mock_smtp.return_value.__enter__.return_value
+        server.sendmail.side_effect = [
+            smtplib.SMTPServerDisconnected("Connection unexpectedly closed"),
+            {},
+        ]
+        provider = GmailProvider("sender@example.com", "password")
+
+        results = provider.send_bulk("Subject", "Body", ["one@example.com"])
+
+        assert results == {"one@example.com": True}
+        assert mock_smtp.call_count == 2
+        assert b"To: one@example.com\r\n" in server.sendmail.call_args[0][2]
+
+    @patch("src.email_service.smtplib.SMTP")
+    def test_send_bulk_auth_failure(self, mock_smtp):
+        """Test that an authentication failure marks every recipient failed."""
+        mock_smtp.return_value.login.side_effect = smtplib.SMTPAuthenticationError(
+            535, b"bad credentials"
+        )
+        provider = GmailProvider("sender@example.com", "password")
+
+        results = provider.send_bulk("Subject", "Body", ["one@example.com"])
+
+        assert results == {"one@example.com": False}
+        mock_smtp.return_value.close.assert_called_once()
+
+
+class TestResendProvider:
+    """Test cases for ResendProvider class."""
+
+    def test_send_email_uses_authenticated_session(self):
+        """Test that sends go through the provider's keep-alive session."""
+        provider = ResendProvider("re_key", "alerts@example.com")
+
+        with patch.object(provider._session, "post") as mock_post:
+            assert provider.send_email("Subject", "Body", "one@example.com")
+
+        assert provider._session.headers["Authorization"] == "Bearer re_key"
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["to"] == ["one@example.com"]
+
+    def test_send_bulk_sends_to_every_recipient(self):
+        """Test that a concurrent bulk send reports a result per recipient."""
+        provider = ResendProvider("re_key", "alerts@example.com", max_rps=1000)
+        recipients = [f"user{i}@example.com" for i in range(5)]
+
+        with patch.object(provider._session, "post") as mock_post:
+            results = provider.send_bulk("Subject", "Body", recipients)
+
+        assert results == {email: True for email in recipients}
+        assert mock_post.call_count == 5
+
+    @patch("time.sleep")
+    def test_send_email_retries_throttled_request(self, _sleep):
+        """Test that a 429 is retried with the same idempotency key."""
+        statuses = [429, 200]
+        keys = []
+
+        class ThrottlingHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                keys.append(self.headers["Idempotency-Key"])
+                self.send_response(statuses.pop(0))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            provider = ResendProvider("re_key", "alerts@example.com")
+            # Route the local plain-HTTP server through the retrying adapter
+            provider._session.mount(
+                "http://", provider._session.get_adapter("https://")
+            )
+            provider.api_url = f"http://127.0.0.1:{server.server_port}/emails"
+
+            assert provider.send_email("Subject", "Body", "one@example.com") is True
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(keys) == 2
+        assert keys[0] and keys[0] == keys[1]
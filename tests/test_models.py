@@ -1,106 +1,106 @@
 """Tests for IPO data models."""
 
+import copy
+import dataclasses
+import pickle
 import pytest
 from datetime import datetime
+from types import MappingProxyType
 from src.models import IPOInfo, NotificationRecord
 
+# Any warning raised by the models is a test failure
+pytestmark = pytest.mark.filterwarnings("error")
+
+# A scraped table row and the heading map that matches it
+_HEADINGS = MappingProxyType(
+    {
+        "Company Name": 2,
+        "Units": 3,
+        "Price": 4,
+        "Open Date": 5,
+        "Close Date": 6,
+        "Status": 1,
+    }
+)
+_ROW = ("1", "open", "Test Company", "1,000,000", "NPR 100", "2025-01-15", "2025-01-25")
+
+_IPO_KWARGS = MappingProxyType(
+    {
+        "company_name": "Test Company",
+        "units_available": "1,000,000",
+        "price_per_unit": "NPR 100",
+        "start_date": "2025-01-15",
+        "end_date": "2025-01-25",
+        "status": "open",
+    }
+)
+_EXPECTED_IPO_DICT = MappingProxyType(
+    {
+        "company_name": "Test Company",
+        "units_available": "1,000,000",
+        "price_per_unit": "NPR 100",
+        "start_date": "2025-01-15",
+        "end_date": "2025-01-25",
+        "status": "open",
+    }
+)
+# Fixed notification time so the record tests are deterministic
+_NOW = datetime(2025, 1, 15, 12, 0, 0)
+_NOW_ISO = _NOW.isoformat()
+
+_REC_KWARGS = MappingProxyType(
+    {
+        "company_name": "Test Company",
+        "notified_at": _NOW,
+        "ipo_data": {"company_name": "Test Company", "status": "open"},
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def base_ipo_kwargs():
+    """Keyword arguments for a valid, open IPO."""
+    return dict(_IPO_KWARGS)
+
+
+@pytest.fixture
+def open_ipo(base_ipo_kwargs):
+    """An open IPO built from base_ipo_kwargs."""
+    return IPOInfo(**base_ipo_kwargs)
+
 
 class TestIPOInfo:
     """Test cases for IPOInfo model."""
 
-    def test_ipo_info_creation(self):
-        """Test IPOInfo creation with valid data."""
-        ipo = IPOInfo(
-            company_name="Test Company",
-            units_available="1,000,000",
-            price_per_unit="NPR 100",
-            start_date="2025-01-15",
-            end_date="2025-01-25",
-            status="open",
-        )
-
-        assert ipo.company_name == "Test Company"
-        assert ipo.is_open is True
+    def test_ipo_info_happy_path(self, open_ipo):
+        """Test IPOInfo creation, status and dictionary conversion."""
+        assert open_ipo.company_name == "Test Company"
+        assert open_ipo.is_open is True
+        assert open_ipo.to_dict() == _EXPECTED_IPO_DICT
 
-    def test_ipo_info_empty_company_name(self):
+    def test_ipo_info_empty_company_name(self, base_ipo_kwargs):
         """Test IPOInfo validation with empty company name."""
-        with pytest.raises(ValueError, match="Company name cannot be empty"):
-            IPOInfo(
-                company_name="",
-                units_available="1,000,000",
-                price_per_unit="NPR 100",
-                start_date="2025-01-15",
-                end_date="2025-01-25",
-                status="open",
-            )
-
-    def test_ipo_info_status_check(self):
-        """Test IPO status checking."""
-        ipo_open = IPOInfo(
-            company_name="Test Company",
-            units_available="1,000,000",
-            price_per_unit="NPR 100",
-            start_date="2025-01-15",
-            end_date="2025-01-25",
-            status="open",
-        )
+        kwargs = {**base_ipo_kwargs, "company_name": ""}
 
-        ipo_closed = IPOInfo(
-            company_name="Test Company",
-            units_available="1,000,000",
-            price_per_unit="NPR 100",
-            start_date="2025-01-15",
-            end_date="2025-01-25",
-            status="closed",
-        )
-
-        assert ipo_open.is_open is True
-        assert ipo_closed.is_open is False
-
-    def test_ipo_info_to_dict(self):
-        """Test IPOInfo to dictionary conversion."""
-        ipo = IPOInfo(
-            company_name="Test Company",
-            units_available="1,000,000",
-            price_per_unit="NPR 100",
-            start_date="2025-01-15",
-            end_date="2025-01-25",
-            status="open",
-        )
+        with pytest.raises(ValueError, match="Company name cannot be empty"):
+            IPOInfo(**kwargs)
 
-        result = ipo.to_dict()
-        expected = {
-            "company_name": "Test Company",
-            "units_available": "1,000,000",
-            "price_per_unit": "NPR 100",
-            "start_date": "2025-01-15",
-            "end_date": "2025-01-25",
-            "status": "open",
-        }
+    @pytest.mark.parametrize(
+        "status,expected", [("open", True), (" Open ", True), ("closed", False)]
+    )
+    def test_ipo_info_is_open(self, base_ipo_kwargs, status, expected):
+        """Test IPO status checking."""
+        assert IPOInfo(**{**base_ipo_kwargs, "status": status}).is_open is expected
 
-        assert result == expected
+    def test_ipo_info_is_immutable(self, open_ipo):
+        """Test that IPOInfo fields cannot be changed after creation."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            open_ipo.status = "closed"
+        assert not hasattr(open_ipo, "__dict__")
 
     def test_ipo_info_from_row_data(self):
         """Test IPOInfo creation from row data."""
-        row_data = [
-            "1",
-            "open",
-            "Test Company",
-            "1,000,000",
-            "NPR 100",
-            "2025-01-15",
-            "2025-01-25",
-        ]
-        headings = {
-            "Company Name": 2,
-            "Units": 3,
-            "Price": 4,
-            "Open Date": 5,
-            "Close Date": 6,
-            "Status": 1,
-        }
-
-        ipo = IPOInfo.from_row_data(row_data, headings)
+        ipo = IPOInfo.from_row_data(_ROW, _HEADINGS)
 
         assert ipo.company_name == "Test Company"
         assert ipo.status == "open"
@@ -112,43 +112,89 @@ class TestNotificationRecord:
 
     def test_notification_record_creation(self):
         """Test NotificationRecord creation."""
-        now = datetime.now()
         ipo_data = {"company_name": "Test Company", "status": "open"}
 
         record = NotificationRecord(
-            company_name="Test Company", notified_at=now, ipo_data=ipo_data
+            company_name="Test Company", notified_at=_NOW, ipo_data=ipo_data
         )
 
         assert record.company_name == "Test Company"
-        assert record.notified_at == now
+        assert record.notified_at == _NOW
         assert record.ipo_data == ipo_data
 
     def test_notification_record_to_dict(self):
         """Test NotificationRecord to dictionary conversion."""
-        now = datetime.now()
         ipo_data = {"company_name": "Test Company", "status": "open"}
 
         record = NotificationRecord(
-            company_name="Test Company", notified_at=now, ipo_data=ipo_data
+            company_name="Test Company", notified_at=_NOW, ipo_data=ipo_data
         )
 
         result = record.to_dict()
 
         assert result["company_name"] == "Test Company"
-        assert result["notified_at"] == now.isoformat()
+        assert result["notified_at"] == _NOW_ISO
         assert result["ipo_data"] == ipo_data
 
     def test_notification_record_from_dict(self):
         """Test NotificationRecord creation from dictionary."""
-        now = datetime.now()
         data = {
             "company_name": "Test Company",
-            "notified_at": now.isoformat(),
+            "notified_at": _NOW_ISO,
             "ipo_data": {"company_name": "Test Company", "status": "open"},
         }
 
         record = NotificationRecord.from_dict(data)
 
         assert record.company_name == "Test Company"
-        assert record.notified_at == now  # ISO format preserves microseconds
+        assert record.notified_at == _NOW
         assert record.ipo_data == data["ipo_data"]
+
+
+@pytest.mark.parametrize(
+    "model,kwargs",
+    [(IPOInfo, _IPO_KWARGS), (NotificationRecord, _REC_KWARGS)],
+    ids=["IPOInfo", "NotificationRecord"],
+)
+def test_to_dict_includes_every_field(model, kwargs):
+    """Test that each model serialises all of its constructor fields."""
+    assert model(**kwargs).to_dict().keys() >= kwargs.keys()
+
+
+@pytest.mark.parametrize(
+    "model,kwargs",
+    [(IPOInfo, _IPO_KWARGS), (NotificationRecord, _REC_KWARGS)],
+    ids=["IPOInfo", "NotificationRecord"],
+)
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_model_copy_round_trip(model, kwargs, clone):
+    """Test that the frozen, slotted models survive copying and pickling."""
+    original = model(**kwargs)
+
+    restored = clone(original)
+
+    assert restored == original
+    # Every slot is restored, including IPOInfo's derived _is_open
+    assert restored.__getstate__() == original.__getstate__()
+
+
+@pytest.mark.benchmark(group="models")
+def test_bench_from_row_data(benchmark):
+    """Benchmark building an IPOInfo from a scraped table row."""
+    ipo = benchmark(IPOInfo.from_row_data, _ROW, _HEADINGS)
+
+    assert ipo.is_open is True
+
+
+@pytest.mark.benchmark(group="models")
+def test_bench_from_dict(benchmark):
+    """Benchmark loading a NotificationRecord from its stored form."""
+    data = {"company_name": "Test Company", "notified_at": _NOW_ISO, "ipo_data": {}}
+
+    record = benchmark(NotificationRecord.from_dict, data)
+
+    assert record.notified_at == _NOW
@@ -0,0 +1,213 @@
+"""Tests for IPO scraping."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.scraper import IPOScraper, IPOExtractionError, _slice_ipo_section
+
+SAMPLE_HTML = """
+<html>
+  <body>
+    <div id="news">Unrelated content</div>
+    <div id="eipo">
+      <table>
+        <thead>
+          <tr>
+            <th>S.N.</th>
+            <th>Status</th>
+            <th>Company Name</th>
+            <th>Units</th>
+            <th>Price</th>
+            <th>Open Date</th>
+            <th>Close Date</th>
+          </tr>
+        </thead>
+        <tbody>
+          <tr>
+            <td>1</td>
+            <td>Coming Soon</td>
+            <td><a href="#">Future   Company</a></td>
+            <td>500,000</td>
+            <td>100</td>
+            <td>2025-02-01</td>
+            <td>2025-02-05</td>
+          </tr>
+          <tr>
+            <td>2</td>
+            <td> Open </td>
+            <td>
+              <a href="#">Test
+                Company</a>
+            </td>
+            <td>1,000,000</td>
+            <td>100</td>
+            <td>2025-01-15</td>
+            <td>2025-01-25</td>
+          </tr>
+        </tbody>
+      </table>
+    </div>
+  </body>
+</html>
+"""
+
+
+class TestIPOScraper:
+    """Test cases for IPOScraper class."""
+
+    def test_extract_ipo_details(self):
+        """Test extraction of headings, rows and the open IPO."""
+        result = IPOScraper().extract_ipo_details(SAMPLE_HTML, collect_all=True)
+
+        assert result["headings"][:3] == ["S.N.", "Status", "Company Name"]
+        assert len(result["data"]) == 2
+        assert result["data"][0][2] == "Future Company"
+
+        open_ipo = result["open_ipo"]
+        assert open_ipo.company_name == "Test Company"
+        assert open_ipo.units_available == "1,000,000"
+        assert open_ipo.is_open is True
+
+    def test_extract_ipo_details_stops_at_open_ipo(self):
+        """Test that rows after the open IPO are not parsed by default."""
+        html = SAMPLE_HTML.replace(
+            "</tbody>",
+            "<tr><td>3</td><td>Closed</td><td>Later Company</td></tr></tbody>",
+        )
+        scraper = IPOScraper()
+
+        assert len(scraper.extract_ipo_details(html)["data"]) == 2
+        assert len(scraper.extract_ipo_details(html, collect_all=True)["data"]) == 3
+
+    def test_extract_ipo_details_from_bytes(self):
+        """Test extraction from raw UTF-8 bytes as fetched from the site."""
+        html = SAMPLE_HTML.replace("Test\n", "Tést\n").encode("utf-8")
+        result = IPOScraper().extract_ipo_details(html)
+
+        assert result["open_ipo"].company_name == "Tést Company"
+
+    def test_extract_ipo_details_no_open_ipo(self):
+        """Test extraction when no IPO is open."""
+        html = SAMPLE_HTML.replace(" Open ", "Closed")
+        result = IPOScraper().extract_ipo_details(html)
+
+        assert result["open_ipo"] is None
+
+    def test_extract_ipo_details_missing_section(self):
+        """Test extraction when the IPO section is missing."""
+        with pytest.raises(IPOExtractionError, match="IPO section not found"):
+            IPOScraper().extract_ipo_details("<html><body></body></html>")
+
+    def test_find_open_ipo(self):
+        """Test the open-IPO fast path."""
+        scraper = IPOScraper()
+
+        assert scraper.find_open_ipo(SAMPLE_HTML).company_name == "Test Company"
+        assert scraper.find_open_ipo(SAMPLE_HTML.replace(" Open ", "Closed")) is None
+
+    def test_find_open_ipo_nbsp_padded_status(self):
+        """Test that a Status cell padded with &nbsp; still counts as open."""
+        scraper = IPOScraper()
+        html = SAMPLE_HTML.replace(" Open ", "&nbsp;Open&nbsp;")
+
+        open_ipo = scraper.find_open_ipo(html)
+
+        assert open_ipo is not None
+        assert open_ipo.company_name == "Test Company"
+
+    def test_find_open_ipo_ignores_open_outside_status(self):
+        """Test that "Open" in another column does not count as open."""
+        html = SAMPLE_HTML.replace(" Open ", "Closed").replace(
+            "Future   Company", "Open"
+        )
+
+        assert IPOScraper().find_open_ipo(html) is None
+
+    def test_slice_ipo_section(self):
+        """Test that the IPO div is cut out with its nested markup intact."""
+        html = SAMPLE_HTML.replace("<table>", "<div class='wrap'><table>").replace(
+            "</table>", "</table></div>"
+        )
+        section = _slice_ipo_section(html.encode("utf-8"))
+
+        assert section.startswith(b'<div id="eipo">')
+        assert section.endswith(b"</table></div>\n    </div>")
+        assert b"Unrelated content" not in section
+
+    def test_slice_ipo_section_not_found(self):
+        """Test that a missing or non-div IPO section is not sliced."""
+        assert _slice_ipo_section(b"<html><body></body></html>") is None
+        assert _slice_ipo_section(b'<section id="eipo"></section>') is None
+
+    def test_slice_ipo_section_ignores_other_attributes(self):
+        """Test that data-id="eipo" on an earlier div is not mistaken for the id."""
+        html = SAMPLE_HTML.replace(
+            "<body>", '<body><div data-id="eipo">Decoy</div>'
+        ).encode("utf-8")
+
+        section = _slice_ipo_section(html)
+
+        assert section.startswith(b'<div id="eipo">')
+        assert IPOScraper().find_open_ipo(html).company_name == "Test Company"
+
+    def test_locate_table_falls_back_when_slice_is_incomplete(self):
+        """Test that a </div> hidden in a comment doesn't break extraction."""
+        html = SAMPLE_HTML.replace("<table>", "<!-- </div> --><table>").encode("utf-8")
+
+        assert _slice_ipo_section(html) is None
+        assert IPOScraper().find_open_ipo(html).company_name == "Test Company"
+
+        # A slice missing the table is re-parsed from the whole page
+        with patch(
+            "src.scraper._slice_ipo_section", return_value=b'<div id="eipo"></div>'
+        ):
+            assert IPOScraper().find_open_ipo(html).company_name == "Test Company"
+
+    def test_has_changed_tracks_recorded_digest(self, tmp_path):
+        """Test that a page is unchanged only after its digest is recorded."""
+        scraper = IPOScraper()
+        file_path = str(tmp_path / "share.html")
+        html = SAMPLE_HTML.encode("utf-8")
+
+        assert scraper.has_changed(html, file_path) is True
+
+        scraper.record_digest(html, file_path)
+
+        assert scraper.has_changed(html, file_path) is False
+        assert scraper.has_changed(html + b"<!-- updated -->", file_path) is True
+
+    def test_fetch_and_save_conditional_get(self, tmp_path):
+        """Test that a 304 response reuses the previously saved page."""
+        scraper = IPOScraper()
+        file_path = str(tmp_path / "share.html")
+        html = SAMPLE_HTML.encode("utf-8")
+
+        fresh = MagicMock(status_code=200, content=html, headers={"ETag": '"v1"'})
+        not_modified = MagicMock(status_code=304, content=b"", headers={})
+
+        with patch.object(
+            scraper.session, "get", side_effect=[fresh, not_modified]
+        ) as mock_get:
+            assert scraper.fetch_and_save(file_path) == html
+            assert scraper.fetch_and_save(file_path) == html
+
+        assert mock_get.call_args_list[0].kwargs["headers"] == {}
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_fetch_html_returns_content_without_saving(self, tmp_path, monkeypatch):
+        """Test that fetch_html keeps the page in memory only."""
+        monkeypatch.chdir(tmp_path)
+        scraper = IPOScraper()
+        html = SAMPLE_HTML.encode("utf-8")
+        response = MagicMock(status_code=200, content=html, headers={})
+
+        with patch.object(scraper.session, "get", return_value=response):
+            assert scraper.fetch_html() == html
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_clean_text(self):
+        """Test whitespace normalisation of cell text."""
+        scraper = IPOScraper()
+
+        assert scraper._clean_text("  Test\n\tCompany   Ltd ") == "Test Company Ltd"
+        assert scraper._clean_text("") == ""